@@ -16,19 +16,13 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import os
+import stat
 import sys
+import zipfile
 from pathlib import Path
 
-from openpyxl import Workbook
-
-
-
-print("Please enter the full absolute path of the CSV file:")
-print("Example: H:\\Repo\\WordpressDevelopment\\Products-Price-Exporter\\vapeclub3-products-price.csv")
-print()
-
-DEFAULT_INPUT = input("> ").strip()
-#DEFAULT_INPUT = Path(r"H:\Repo\WordpressDevelopment\Products-Price-Exporter\vapeclub3-products-price.csv")
 
 def normalize_user_path(raw: str) -> Path:
         """
@@ -42,8 +36,6 @@ def normalize_user_path(raw: str) -> Path:
         """
         cleaned = raw.strip().strip('"').strip("'").strip()
         return Path(cleaned)
-        
-DEFAULT_INPUT = normalize_user_path(DEFAULT_INPUT)
 
 
 def validate_csv_path(path: Path) -> tuple[bool, str]:
@@ -62,48 +54,208 @@ def validate_csv_path(path: Path) -> tuple[bool, str]:
         if path.suffix.lower() != ".csv":
             return False, "Input file must have .csv extension"
         
-        if not path.exists():
+        # One stat call covers both the existence and the file-type check
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
             return False, f"File not found: {path}"
         
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return False, f"Path is not a file: {path}"
         
         return True, ""
 
 
-is_valid, error_message = validate_csv_path(DEFAULT_INPUT)
-if not is_valid:
-    print(error_message)
-    exit(1)
-    
-DEFAULT_OUTPUT = DEFAULT_INPUT.with_suffix(".xlsx")
+# Fast deflate: the sheet XML is written once and mostly short strings
+ZIP_COMPRESS_LEVEL = 1
+
+# XML escaping in one str.translate pass; also drops control characters
+# that are not allowed in XML 1.0 (everything below 0x20 except tab/LF/CR)
+_XML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&apos;",
+    **{chr(code): None for code in range(0x20) if code not in (0x09, 0x0A, 0x0D)},
+})
+
+_SPREADSHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_RELATIONSHIPS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_OFFICE_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_CONTENT_TYPES_XML = (
+    _XML_DECLARATION
+    + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+
+_ROOT_RELS_XML = (
+    _XML_DECLARATION
+    + f'<Relationships xmlns="{_RELATIONSHIPS_NS}">'
+    f'<Relationship Id="rId1" Type="{_OFFICE_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+_WORKBOOK_RELS_XML = (
+    _XML_DECLARATION
+    + f'<Relationships xmlns="{_RELATIONSHIPS_NS}">'
+    f'<Relationship Id="rId1" Type="{_OFFICE_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{_OFFICE_REL_NS}/styles" Target="styles.xml"/>'
+    "</Relationships>"
+)
+
+_STYLES_XML = (
+    _XML_DECLARATION
+    + f'<styleSheet xmlns="{_SPREADSHEET_NS}">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+
+
+class FastXlsxWriter:
+    """
+    Minimal streaming XLSX writer (single sheet, text cells only).
+
+    Writes the OOXML parts directly into the zip archive and streams
+    worksheet rows as inline strings, so no per-cell objects are kept
+    in memory. Rows must be appended in order.
+
+    The archive is built in a temporary file next to output_path and only
+    moved into place by close(); abort() (or leaving the context with an
+    exception) discards it, so a failed conversion never leaves a
+    truncated workbook or replaces an existing one.
+    """
+
+    def __init__(self, output_path: Path, sheet_name: str = "Products") -> None:
+        self.output_path = output_path
+        self.rows_written = 0
+
+        self._temp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        self._sheet = None
+        self._archive = zipfile.ZipFile(
+            self._temp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESS_LEVEL
+        )
+        try:
+            self._archive.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+            self._archive.writestr("_rels/.rels", _ROOT_RELS_XML)
+            self._archive.writestr(
+                "xl/workbook.xml",
+                _XML_DECLARATION
+                + f'<workbook xmlns="{_SPREADSHEET_NS}" xmlns:r="{_OFFICE_REL_NS}">'
+                f'<sheets><sheet name="{sheet_name.translate(_XML_ESCAPE)}" sheetId="1" r:id="rId1"/></sheets>'
+                "</workbook>",
+            )
+            self._archive.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+            self._archive.writestr("xl/styles.xml", _STYLES_XML)
+
+            self._sheet = self._archive.open("xl/worksheets/sheet1.xml", "w")
+            self._sheet.write(
+                (_XML_DECLARATION + f'<worksheet xmlns="{_SPREADSHEET_NS}"><sheetData>').encode("utf-8")
+            )
+        except BaseException:
+            self.abort()
+            raise
+
+    def append(self, values: list[str]) -> None:
+        """Append one row of text values (empty values are left blank)."""
+        self.rows_written += 1
+        row_number = self.rows_written
+        cells = [
+            b'<c r="%s%d" t="inlineStr"><is><t xml:space="preserve">%s</t></is></c>'
+            % (
+                _column_letter(col_idx),
+                row_number,
+                value.translate(_XML_ESCAPE).encode("utf-8"),
+            )
+            for col_idx, value in enumerate(values)
+            if value
+        ]
+        self._sheet.write(b'<row r="%d">%s</row>' % (row_number, b"".join(cells)))
+
+    def close(self) -> None:
+        """Finish the worksheet, close the archive and move it to output_path."""
+        try:
+            if self._sheet is not None:
+                self._sheet.write(b"</sheetData></worksheet>")
+                self._sheet.close()
+                self._sheet = None
+            self._archive.close()
+            os.replace(self._temp_path, self.output_path)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self) -> None:
+        """Close the archive without finishing it and delete the temporary file."""
+        try:
+            if self._sheet is not None:
+                self._sheet.close()
+                self._sheet = None
+            self._archive.close()
+        finally:
+            self._temp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> FastXlsxWriter:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+@functools.lru_cache(maxsize=None)
+def _column_letter(col_idx: int) -> bytes:
+    """Convert a zero-based column index to an Excel column letter."""
+    letters = ""
+    col_idx += 1
+    while col_idx:
+        col_idx, remainder = divmod(col_idx - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters.encode("ascii")
+
 
 def convert_csv_to_excel(input_csv: Path, output_xlsx: Path) -> tuple[int, int]:
     """
     Convert CSV -> XLSX.
 
+    Rows are streamed straight into the sheet XML by FastXlsxWriter, so
+    they are written once and cannot be revisited after they are appended.
+
     Returns:
         (rows_written, skipped_empty_rows)
     """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Products"
-
-    # Required fixed output headers
-    ws.cell(row=1, column=1, value="نام محصول")
-    ws.cell(row=1, column=2, value="قیمت")
-
     rows_written = 0
     skipped_empty_rows = 0
-    out_row = 2
 
-    with input_csv.open("r", encoding="utf-8-sig", newline="") as f:
+    # Open the input first so an unreadable CSV never creates a workbook
+    with input_csv.open("r", encoding="utf-8-sig", newline="") as f, \
+            FastXlsxWriter(output_xlsx, "Products") as ws:
+        # Required fixed output headers
+        ws.append(["نام محصول", "قیمت"])
+
         reader = csv.reader(f)
 
         # Skip CSV header if present. We still force our own fixed header in Excel.
         first = next(reader, None)
         if first is None:
-            wb.save(output_xlsx)
             return rows_written, skipped_empty_rows
 
         for row in reader:
@@ -121,13 +273,9 @@ def convert_csv_to_excel(input_csv: Path, output_xlsx: Path) -> tuple[int, int]:
                 continue
 
             # Write as text to preserve exact CSV values
-            ws.cell(row=out_row, column=1, value=str(product_name))
-            ws.cell(row=out_row, column=2, value=str(price))
-
-            out_row += 1
+            ws.append([str(product_name), str(price)])
             rows_written += 1
 
-    wb.save(output_xlsx)
     return rows_written, skipped_empty_rows
 
 
@@ -137,17 +285,33 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--input",
-        type=Path,
-        default=DEFAULT_INPUT,
-        help=f"Input CSV path (default: {DEFAULT_INPUT})",
+        type=normalize_user_path,
+        help="Input CSV absolute path (prompted for when omitted in an interactive terminal)",
     )
     parser.add_argument(
         "--output",
         type=Path,
-        default=DEFAULT_OUTPUT,
-        help=f"Output XLSX path (default: {DEFAULT_OUTPUT})",
+        help="Output XLSX path (default: input path with .xlsx extension)",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+
+    if args.input is None:
+        # Only prompt when a user can answer; scripted runs must pass --input
+        if not sys.stdin.isatty():
+            parser.error("--input is required when stdin is not a terminal")
+
+        print("Please enter the full absolute path of the CSV file:")
+        print("Example: H:\\Repo\\WordpressDevelopment\\Products-Price-Exporter\\vapeclub3-products-price.csv")
+        print()
+        args.input = normalize_user_path(input("> "))
+    else:
+        # Relative --input values are taken relative to the current directory
+        args.input = args.input.resolve()
+
+    if args.output is None:
+        args.output = args.input.with_suffix(".xlsx")
+
+    return args
 
 
 def main() -> int:
@@ -155,8 +319,9 @@ def main() -> int:
     input_csv = args.input
     output_xlsx = args.output
 
-    if not input_csv.exists():
-        print(f"[ERROR] Input CSV not found: {input_csv}", file=sys.stderr)
+    is_valid, error_message = validate_csv_path(input_csv)
+    if not is_valid:
+        print(f"[ERROR] {error_message}", file=sys.stderr)
         return 1
 
     output_xlsx.parent.mkdir(parents=True, exist_ok=True)
@@ -5,8 +5,9 @@ CSV to Excel Converter - Professional Edition
 Features:
 - OOP Architecture with extensible design
 - High-performance processing for large files
+- Vectorized CSV parsing and deduplication when pandas is installed
 - Duplicate detection (Persian/English/Mixed product names)
-- Dynamic column detection (2 or 3+ columns)
+- Dynamic column detection (2 or 3 columns)
 - Comprehensive logging system
 - Excel 2010-2026 compatibility
 - UTF-8 and Persian text support
@@ -18,18 +19,34 @@ Version: 2.0.0
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
+import itertools
 import logging
+import os
+import stat
 import sys
+import time
 import unicodedata
+import warnings
+import zipfile
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Final, Iterator
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+from openpyxl.writer.excel import ExcelWriter as WorkbookArchiveWriter
+
+try:
+    import pandas as pd
+except ImportError:  # Optional: falls back to the streaming CSVReader path
+    pd = None
 
 
 # ============================================================================
@@ -47,8 +64,16 @@ class Config:
     MAX_EXCEL_ROWS: Final[int] = 1_048_576
     MAX_EXCEL_COLUMNS: Final[int] = 16_384
     
+    # Column layout (None keeps Excel's default width)
+    COLUMN_WIDTH: Final[float | None] = 30
+    COLUMN_LETTERS: Final[tuple[str, ...]] = ("A", "B", "C")
+    MAX_DATA_COLUMNS: Final[int] = 3  # Name, price, category
+    
     # Performance settings
     CHUNK_SIZE: Final[int] = 1000  # Process rows in chunks for memory efficiency
+    READ_BUFFER_SIZE: Final[int] = 1 << 20  # 1 MiB binary read buffer for CSV input
+    ZIP_COMPRESS_LEVEL: Final[int] = 1  # Fast deflate for the .xlsx archive
+    PROGRESS_LOG_INTERVAL: Final[int] = 1000  # Log progress every N rows
     
     # Logging
     LOG_FORMAT: Final[str] = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -63,46 +88,47 @@ class Config:
 
 
 # ============================================================================
-# DATA MODELS
+# NORMALIZATION HELPERS
 # ============================================================================
 
-@dataclass
-class ProductRecord:
-    """Represents a single product record."""
+def normalize_product_name(name: str) -> str:
+    """
+    Normalize product name for duplicate detection.
+    Strips, NFKC-normalizes, lowercases and collapses whitespace.
+    Handles Persian, English, and mixed text.
+    """
+    if not name:
+        return ""
     
-    product_name: str
-    price: str
-    category: str = ""
-    row_number: int = 0
+    # ASCII text is already NFKC, skip Unicode normalization
+    if name.isascii():
+        return ' '.join(name.lower().split())
     
-    def is_valid(self) -> bool:
-        """Check if record has minimum required data."""
-        return bool(self.product_name.strip())
+    # Normalize Unicode (handle Persian variants) only when needed
+    if not unicodedata.is_normalized('NFKC', name):
+        name = unicodedata.normalize('NFKC', name)
     
-    def normalize_name(self) -> str:
-        """
-        Normalize product name for duplicate detection.
-        Handles Persian, English, and mixed text.
-        """
-        if not self.product_name:
-            return ""
-        
-        # Strip whitespace
-        normalized = self.product_name.strip()
-        
-        # Normalize Unicode (handle Persian variants)
-        normalized = unicodedata.normalize('NFKC', normalized)
-        
-        # Convert to lowercase for case-insensitive comparison
-        normalized = normalized.lower()
-        
-        # Remove extra whitespace
-        normalized = ' '.join(normalized.split())
-        
-        return normalized
+    # Lowercase and remove extra whitespace
+    return ' '.join(name.lower().split())
 
 
-@dataclass
+def product_name_digest(normalized_name: str) -> int:
+    """
+    Compute the 64-bit BLAKE2b digest used to track seen product names.
+    Storing the digest instead of the normalized string keeps memory flat
+    on very large files.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(normalized_name.encode("utf-8"), digest_size=8).digest(),
+        "little"
+    )
+
+
+# ============================================================================
+# DATA MODELS
+# ============================================================================
+
+@dataclass(slots=True)
 class ConversionStatistics:
     """Statistics for conversion process."""
     
@@ -113,9 +139,22 @@ class ConversionStatistics:
     unique_products_written: int = 0
     columns_detected: int = 0
     processing_time_seconds: float = 0.0
+    _summary: str | None = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        """Set a field and drop the cached summary text."""
+        object.__setattr__(self, name, value)
+        if name != "_summary":
+            object.__setattr__(self, "_summary", None)
     
     def __str__(self) -> str:
-        """Format statistics for display."""
+        """Format statistics for display (cached until a field changes)."""
+        if self._summary is None:
+            self._summary = self._format()
+        return self._summary
+    
+    def _format(self) -> str:
+        """Build the statistics summary text."""
         return (
             f"\n{'='*60}\n"
             f"CONVERSION STATISTICS\n"
@@ -135,61 +174,87 @@ class ConversionStatistics:
 # CORE BUSINESS LOGIC CLASSES
 # ============================================================================
 
-class DuplicateDetector:
+class CSVReader:
     """
-    High-performance duplicate detection for product names.
-    Supports Persian, English, and mixed text.
+    Efficient CSV reader with chunking support for large files.
     """
     
-    def __init__(self) -> None:
-        """Initialize duplicate detector with hash set."""
-        self._seen_products: set[str] = set()
-        self._duplicate_count: int = 0
+    def __init__(self, file_path: Path, encoding: str = Config.CSV_ENCODING) -> None:
+        """
+        Initialize CSV reader.
+        
+        Args:
+            file_path: Path to CSV file
+            encoding: File encoding (default: UTF-8 with BOM)
+        """
+        self.file_path = file_path
+        self.encoding = encoding
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Set from the first CSV row by open_rows (minimum 2 columns)
+        self.detected_columns: int = 2
     
-    def is_duplicate(self, product: ProductRecord) -> bool:
+    @staticmethod
+    def count_columns(first_row: list[str] | None) -> int:
         """
-        Check if product name is duplicate (case-insensitive, normalized).
+        Count non-empty columns in the first CSV row.
+        
+        Only the first Config.MAX_DATA_COLUMNS fields are considered, since
+        that is all that gets written; the result is between 2 and that cap.
         
         Args:
-            product: ProductRecord to check
+            first_row: First CSV row, or None for an empty file
             
         Returns:
-            True if duplicate, False if unique
+            Number of columns
         """
-        normalized_name = product.normalize_name()
+        if not first_row:
+            return 2  # Default to 2 columns
         
-        if not normalized_name:
-            return False
+        header_fields = first_row[:Config.MAX_DATA_COLUMNS]
+        return max(len([col for col in header_fields if col.strip()]), 2)
+    
+    @contextmanager
+    def open_rows(self, skip_header: bool = True) -> Iterator[Iterator[list[str]]]:
+        """
+        Open the CSV file and provide its raw row iterator.
         
-        if normalized_name in self._seen_products:
-            self._duplicate_count += 1
-            return True
+        The column count is detected from the first row in the same pass
+        and stored on detected_columns before the iterator is handed out.
         
-        self._seen_products.add(normalized_name)
-        return False
-    
-    def get_duplicate_count(self) -> int:
-        """Get total number of duplicates detected."""
-        return self._duplicate_count
-    
-    def get_unique_count(self) -> int:
-        """Get total number of unique products."""
-        return len(self._seen_products)
-    
-    def reset(self) -> None:
-        """Clear all tracked products."""
-        self._seen_products.clear()
-        self._duplicate_count = 0
+        Args:
+            skip_header: Whether to skip first row
+            
+        Yields:
+            Iterator over raw CSV rows (lists of strings)
+        """
+        self.logger.info(f"Reading CSV file: {self.file_path}")
+        
+        raw = open(self.file_path, "rb", buffering=Config.READ_BUFFER_SIZE)
+        with io.TextIOWrapper(raw, encoding=self.encoding, newline="") as f:
+            reader = csv.reader(f)
+            
+            # Detect column count from the first row, then skip it if requested
+            first_row = next(reader, None)
+            self.detected_columns = self.count_columns(first_row)
+            if first_row is not None and not skip_header:
+                reader = itertools.chain((first_row,), reader)
+            
+            yield reader
 
 
-class CSVReader:
+class PandasCSVReader:
     """
-    Efficient CSV reader with chunking support for large files.
+    Vectorized CSV reader built on pandas (optional dependency).
+    Parses the whole file with the C parser and computes duplicate keys
+    column-wise instead of per record.
     """
     
+    COLUMNS: Final[list[str]] = ["name", "price", "category"]
+    
     def __init__(self, file_path: Path, encoding: str = Config.CSV_ENCODING) -> None:
         """
-        Initialize CSV reader.
+        Initialize pandas CSV reader.
         
         Args:
             file_path: Path to CSV file
@@ -198,88 +263,63 @@ class CSVReader:
         self.file_path = file_path
         self.encoding = encoding
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Set from the first CSV row by read_frame (minimum 2 columns)
+        self.detected_columns: int = 2
     
-    def read_records(self, skip_header: bool = True) -> Iterator[ProductRecord]:
+    def read_frame(self, skip_header: bool = True) -> pd.DataFrame:
         """
-        Read CSV records efficiently with streaming.
+        Read CSV into a DataFrame with stripped fields and a normalized key.
         
         Args:
             skip_header: Whether to skip first row
             
-        Yields:
-            ProductRecord objects
+        Returns:
+            DataFrame with name, price, category and _k (normalized name) columns
         """
         self.logger.info(f"Reading CSV file: {self.file_path}")
         
-        try:
-            with self.file_path.open("r", encoding=self.encoding, newline="") as f:
-                reader = csv.reader(f)
-                
-                # Skip header if requested
-                if skip_header:
-                    next(reader, None)
-                
-                row_number = 2 if skip_header else 1
-                
-                for row in reader:
-                    if not row:
-                        yield ProductRecord(
-                            product_name="",
-                            price="",
-                            category="",
-                            row_number=row_number
-                        )
-                        row_number += 1
-                        continue
-                    
-                    # Extract fields based on available columns
-                    product_name = row[0].strip() if len(row) >= 1 else ""
-                    price = row[1].strip() if len(row) >= 2 else ""
-                    category = row[2].strip() if len(row) >= 3 else ""
-                    
-                    yield ProductRecord(
-                        product_name=product_name,
-                        price=price,
-                        category=category,
-                        row_number=row_number
-                    )
-                    
-                    row_number += 1
-                    
-        except Exception as e:
-            self.logger.error(f"Error reading CSV file: {e}")
-            raise
-    
-    def detect_column_count(self) -> int:
-        """
-        Detect number of columns in CSV file.
+        # Fields past the category column are dropped on purpose (only
+        # Config.MAX_DATA_COLUMNS are written), so silence pandas' warning
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", pd.errors.ParserWarning)
+            df = pd.read_csv(
+                self.file_path,
+                encoding=self.encoding,
+                header=None,
+                names=self.COLUMNS,
+                index_col=False,
+                # Prices and categories repeat a lot: parse them as categoricals
+                # so each distinct value is stored (and stripped) only once
+                dtype={"name": str, "price": "category", "category": "category"},
+                keep_default_na=False,
+                skip_blank_lines=False,
+            )
         
-        Returns:
-            Number of columns
-        """
-        try:
-            with self.file_path.open("r", encoding=self.encoding, newline="") as f:
-                reader = csv.reader(f)
-                first_row = next(reader, None)
-                
-                if not first_row:
-                    return 2  # Default to 2 columns
-                
-                # Count non-empty columns
-                col_count = len([col for col in first_row if col.strip()])
-                
-                # Ensure minimum 2 columns
-                return max(col_count, 2)
-                
-        except Exception as e:
-            self.logger.warning(f"Could not detect column count: {e}. Using default (2)")
-            return 2
+        for column in self.COLUMNS:
+            df[column] = df[column].str.strip()
+        df = df.fillna("")
+        
+        # Detect column count from the first row, then skip it if requested
+        first_row = df.iloc[0].tolist() if len(df) else None
+        self.detected_columns = CSVReader.count_columns(first_row)
+        if skip_header:
+            df = df.iloc[1:]
+        
+        # Same normalization as normalize_product_name
+        df["_k"] = (
+            df["name"].str.normalize("NFKC").str.lower().str.split().str.join(" ")
+        )
+        return df
 
 
 class ExcelWriter:
     """
     High-performance Excel writer with formatting and compatibility.
     Excel 2010-2026 compatible.
+
+    Uses openpyxl write-only mode: rows are streamed to the sheet in order
+    and memory stays constant regardless of row count.
     """
     
     def __init__(self, output_path: Path, column_count: int = 2) -> None:
@@ -294,10 +334,9 @@ class ExcelWriter:
         self.column_count = column_count
         self.logger = logging.getLogger(self.__class__.__name__)
         
-        # Create workbook
-        self.workbook = Workbook()
-        self.worksheet: Worksheet = self.workbook.active
-        self.worksheet.title = "Products"
+        # Create workbook (write-only, rows are appended sequentially)
+        self.workbook = Workbook(write_only=True)
+        self.worksheet: WriteOnlyWorksheet = self.workbook.create_sheet("Products")
         
         # Initialize
         self._setup_headers()
@@ -311,50 +350,44 @@ class ExcelWriter:
         header_font = Font(bold=True, size=11)
         header_alignment = Alignment(horizontal="center", vertical="center")
         
+        # Column widths must be set before the first row is appended
+        if Config.COLUMN_WIDTH is not None:
+            for col_idx in range(self.column_count):
+                if col_idx < len(Config.COLUMN_LETTERS):
+                    column_letter = Config.COLUMN_LETTERS[col_idx]
+                else:
+                    column_letter = get_column_letter(col_idx + 1)
+                self.worksheet.column_dimensions[column_letter].width = Config.COLUMN_WIDTH
+        
         # Write headers based on column count
+        header_cells = []
         for col_idx in range(self.column_count):
             header_text = Config.DEFAULT_HEADERS.get(col_idx, f"ستون {col_idx + 1}")
-            cell = self.worksheet.cell(row=1, column=col_idx + 1, value=header_text)
+            cell = WriteOnlyCell(self.worksheet, value=header_text)
             cell.font = header_font
             cell.alignment = header_alignment
+            header_cells.append(cell)
         
-        # Auto-adjust column widths
-        for col_idx in range(self.column_count):
-            column_letter = get_column_letter(col_idx + 1)
-            self.worksheet.column_dimensions[column_letter].width = 30
+        self.worksheet.append(header_cells)
     
-    def write_record(self, record: ProductRecord) -> None:
+    def write_row(self, product_name: str, price: str, category: str = "") -> None:
         """
-        Write a product record to Excel.
+        Write raw product values to Excel.
         
         Args:
-            record: ProductRecord to write
+            product_name: Product name
+            price: Product price
+            category: Product category (written only for 3+ columns)
         """
         if self._current_row > Config.MAX_EXCEL_ROWS:
             self.logger.warning(f"Reached Excel row limit: {Config.MAX_EXCEL_ROWS}")
             raise ValueError(f"Excel row limit reached: {Config.MAX_EXCEL_ROWS}")
         
-        # Write product name
-        self.worksheet.cell(
-            row=self._current_row,
-            column=1,
-            value=record.product_name
-        )
-        
-        # Write price
-        self.worksheet.cell(
-            row=self._current_row,
-            column=2,
-            value=record.price
-        )
-        
-        # Write category if present
-        if self.column_count >= 3 and record.category:
-            self.worksheet.cell(
-                row=self._current_row,
-                column=3,
-                value=record.category
-            )
+        # Write product name, price and category (if present) as one row
+        if self.column_count >= 3:
+            self.worksheet.append([product_name, price, category or None])
+        else:
+            self.worksheet.append([product_name, price])
         
         self._current_row += 1
     
@@ -363,7 +396,16 @@ class ExcelWriter:
         self.logger.info(f"Saving Excel file: {self.output_path}")
         
         try:
-            self.workbook.save(self.output_path)
+            # Same as Workbook.save, but with a cheaper compression level
+            self.workbook.properties.modified = datetime.now(timezone.utc).replace(tzinfo=None)
+            with zipfile.ZipFile(
+                self.output_path,
+                "w",
+                zipfile.ZIP_DEFLATED,
+                allowZip64=True,
+                compresslevel=Config.ZIP_COMPRESS_LEVEL
+            ) as archive:
+                WorkbookArchiveWriter(self.workbook, archive).save()
             self.logger.info(f"Excel file saved successfully: {self.output_path}")
         except Exception as e:
             self.logger.error(f"Error saving Excel file: {e}")
@@ -408,15 +450,118 @@ class PathValidator:
         if path.suffix.lower() != ".csv":
             return False, "Input file must have .csv extension"
         
-        if not path.exists():
+        # One stat call covers both the existence and the file-type check
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
             return False, f"File not found: {path}"
         
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return False, f"Path is not a file: {path}"
         
         return True, ""
 
 
+# ============================================================================
+# STREAMING PIPELINE
+# ============================================================================
+
+def stream_csv_to_xlsx(
+    input_path: Path,
+    output_path: Path,
+    statistics: ConversionStatistics | None = None
+) -> ConversionStatistics:
+    """
+    Read, validate, deduplicate and write CSV rows to Excel in one loop.
+    
+    Duplicates are tracked as 64-bit digests of the normalized name (see
+    product_name_digest), no object is allocated per row and the hot
+    callables are bound to locals before the loop.
+    
+    Args:
+        input_path: Path to input CSV file
+        output_path: Path for output Excel file
+        statistics: Optional statistics object to fill in
+        
+    Returns:
+        ConversionStatistics object with results (processing time not set)
+    """
+    if statistics is None:
+        statistics = ConversionStatistics()
+    
+    logger = logging.getLogger("StreamingPipeline")
+    csv_reader = CSVReader(input_path)
+    
+    with csv_reader.open_rows(skip_header=True) as rows:
+        column_count = csv_reader.detected_columns
+        statistics.columns_detected = column_count
+        logger.info(f"Detected {column_count} columns in CSV")
+        
+        excel_writer = ExcelWriter(output_path, column_count)
+        
+        # Local bindings for the hot loop
+        strip = str.strip
+        normalize_name = normalize_product_name
+        name_digest = product_name_digest
+        seen: set[int] = set()
+        seen_add = seen.add
+        write_row = excel_writer.write_row
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        total = empty = invalid = duplicates = 0
+        progress_countdown = Config.PROGRESS_LOG_INTERVAL
+        
+        for row_number, row in enumerate(rows, start=2):
+            total += 1
+            
+            # Log progress for large files (every 1000 rows)
+            progress_countdown -= 1
+            if not progress_countdown:
+                logger.info(f"Processed {total:,} rows...")
+                progress_countdown = Config.PROGRESS_LOG_INTERVAL
+            
+            # Pad short (or empty) rows so all three fields exist
+            product_name, price, category = (*row, "", "", "")[:3]
+            product_name = strip(product_name)
+            price = strip(price)
+            
+            # Skip empty rows and rows without a product name
+            if not product_name:
+                if not price:
+                    empty += 1
+                    if debug_enabled:
+                        logger.debug("Skipped empty row: %d", row_number)
+                else:
+                    invalid += 1
+                    logger.warning("Skipped invalid row %d: empty product name", row_number)
+                continue
+            
+            # Check for duplicates
+            normalized_name = normalize_name(product_name)
+            if normalized_name:
+                digest = name_digest(normalized_name)
+                if digest in seen:
+                    duplicates += 1
+                    if debug_enabled:
+                        logger.debug(
+                            "Skipped duplicate product at row %d: %s", row_number, product_name
+                        )
+                    continue
+                seen_add(digest)
+            
+            # Write to Excel
+            write_row(product_name, price, strip(category))
+    
+    excel_writer.save()
+    
+    statistics.total_rows_read = total
+    statistics.empty_rows_skipped = empty
+    statistics.invalid_rows_skipped = invalid
+    statistics.duplicate_rows_skipped = duplicates
+    statistics.unique_products_written = excel_writer.get_rows_written()
+    return statistics
+
+
 # ============================================================================
 # MAIN CONVERTER CLASS
 # ============================================================================
@@ -442,8 +587,6 @@ class CSVToExcelConverter:
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # Components
-        self.csv_reader = CSVReader(self.input_path)
-        self.duplicate_detector = DuplicateDetector()
         self.statistics = ConversionStatistics()
         
         # Performance tracking
@@ -456,8 +599,7 @@ class CSVToExcelConverter:
         Returns:
             ConversionStatistics object with results
         """
-        import time
-        self._start_time = time.time()
+        self._start_time = time.perf_counter()
         
         self.logger.info("="*60)
         self.logger.info("Starting CSV to Excel conversion")
@@ -466,23 +608,12 @@ class CSVToExcelConverter:
         self.logger.info("="*60)
         
         try:
-            # Detect column count
-            self.statistics.columns_detected = self.csv_reader.detect_column_count()
-            self.logger.info(f"Detected {self.statistics.columns_detected} columns in CSV")
-            
-            # Initialize Excel writer
-            excel_writer = ExcelWriter(self.output_path, self.statistics.columns_detected)
-            
-            # Process records
-            self._process_records(excel_writer)
-            
-            # Save Excel file
-            excel_writer.save()
+            # Process records and save Excel file (vectorized when pandas is available)
+            if not self._process_frame():
+                self._process_records()
             
             # Finalize statistics
-            self.statistics.processing_time_seconds = time.time() - self._start_time
-            self.statistics.unique_products_written = excel_writer.get_rows_written()
-            self.statistics.duplicate_rows_skipped = self.duplicate_detector.get_duplicate_count()
+            self.statistics.processing_time_seconds = time.perf_counter() - self._start_time
             
             self.logger.info("Conversion completed successfully")
             self.logger.info(str(self.statistics))
@@ -493,42 +624,59 @@ class CSVToExcelConverter:
             self.logger.error(f"Conversion failed: {e}", exc_info=True)
             raise
     
-    def _process_records(self, excel_writer: ExcelWriter) -> None:
+    def _process_records(self) -> None:
+        """Process CSV records and write to Excel with the fused streaming loop."""
+        stream_csv_to_xlsx(self.input_path, self.output_path, self.statistics)
+    
+    def _process_frame(self) -> bool:
         """
-        Process CSV records and write to Excel.
+        Filter and deduplicate the CSV with pandas, then write to Excel.
         
-        Args:
-            excel_writer: ExcelWriter instance
+        Returns:
+            False if pandas is unavailable or cannot parse the file
+            (nothing has been written in that case)
         """
-        for record in self.csv_reader.read_records(skip_header=True):
-            self.statistics.total_rows_read += 1
-            
-            # Skip empty rows
-            if not record.product_name and not record.price:
-                self.statistics.empty_rows_skipped += 1
-                self.logger.debug(f"Skipped empty row: {record.row_number}")
-                continue
-            
-            # Validate record
-            if not record.is_valid():
-                self.statistics.invalid_rows_skipped += 1
-                self.logger.warning(f"Skipped invalid row {record.row_number}: empty product name")
-                continue
-            
-            # Check for duplicates
-            if self.duplicate_detector.is_duplicate(record):
-                self.logger.debug(
-                    f"Skipped duplicate product at row {record.row_number}: "
-                    f"{record.product_name}"
-                )
-                continue
-            
-            # Write to Excel
-            excel_writer.write_record(record)
-            
-            # Log progress for large files (every 1000 records)
-            if self.statistics.total_rows_read % 1000 == 0:
-                self.logger.info(f"Processed {self.statistics.total_rows_read:,} rows...")
+        if pd is None:
+            return False
+        
+        frame_reader = PandasCSVReader(self.input_path)
+        try:
+            df = frame_reader.read_frame(skip_header=True)
+        except pd.errors.ParserError as e:
+            self.logger.warning(f"Falling back to streaming CSV reader: {e}")
+            return False
+        
+        column_count = frame_reader.detected_columns
+        self.statistics.columns_detected = column_count
+        self.logger.info(f"Detected {column_count} columns in CSV")
+        excel_writer = ExcelWriter(self.output_path, column_count)
+        
+        self.statistics.total_rows_read = len(df)
+        
+        # Skip empty rows and rows without a product name
+        no_name = df["name"] == ""
+        empty = no_name & (df["price"] == "")
+        self.statistics.empty_rows_skipped = int(empty.sum())
+        self.statistics.invalid_rows_skipped = int((no_name & ~empty).sum())
+        if self.statistics.invalid_rows_skipped:
+            self.logger.warning(
+                f"Skipped {self.statistics.invalid_rows_skipped:,} invalid rows: empty product name"
+            )
+        
+        # Drop duplicates, keeping the first occurrence of each product
+        df = df[~no_name]
+        duplicates = df["_k"].duplicated() & (df["_k"] != "")
+        self.statistics.duplicate_rows_skipped = int(duplicates.sum())
+        df = df[~duplicates]
+        
+        for product_name, price, category in df[PandasCSVReader.COLUMNS].itertuples(
+            index=False, name=None
+        ):
+            excel_writer.write_row(product_name, price, category)
+        
+        excel_writer.save()
+        self.statistics.unique_products_written = excel_writer.get_rows_written()
+        return True
 
 
 # ============================================================================
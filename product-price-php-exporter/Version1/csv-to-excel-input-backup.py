@@ -11,24 +11,124 @@ CSV -> Excel converter (interactive input path).
 from __future__ import annotations
 
 import csv
+import hashlib
+import json
+import os
+import stat
 import sys
+import unicodedata
 from pathlib import Path
 
 from openpyxl import Workbook
 
 
+# Whitespace and quote characters trimmed from user-entered paths
+_QUOTE_WS = " \t\r\n\"'"
+
+
 def normalize_user_path(raw: str) -> Path:
     """Normalize input path from user (handles quotes and spaces)."""
-    cleaned = raw.strip().strip('"').strip("'").strip()
-    return Path(cleaned)
+    return Path(raw.strip(_QUOTE_WS))
+
+
+def _norm_key(s: str) -> str:
+    """Build the duplicate-detection key (trimmed, NFC, case-folded product name).
+
+    Names are only stripped when they start or end with whitespace, clean
+    lowercase ASCII names are returned as-is, and only names that fail the
+    NFC quick check are re-normalized.
+    """
+    if s[:1].isspace() or s[-1:].isspace():
+        s = s.strip()
+    if s.isascii():
+        return s if s.islower() else s.lower()
+    if not unicodedata.is_normalized("NFC", s):
+        s = unicodedata.normalize("NFC", s)
+    return s.casefold()
+
+
+# Chunk size used when hashing the input CSV
+_HASH_CHUNK_SIZE = 1 << 20
+# Bump when the sidecar layout or the meaning of its statistics changes
+_CACHE_FORMAT_VERSION = 1
+_CACHE_STAT_KEYS = ("total_rows", "duplicates_found", "unique_products")
+
+
+def _file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_sidecar(output_path: Path) -> Path:
+    """Path of the sidecar that records the input hash and statistics of an output."""
+    return output_path.with_name(output_path.name + ".sha256.json")
+
+
+def _load_cached_statistics(output_path: Path, input_sha256: str) -> dict[str, int] | None:
+    """
+    Return the statistics of a previous conversion of the same input.
+
+    Returns None when the output or its sidecar is missing or unreadable,
+    the sidecar has another format version or incomplete statistics, it was
+    written for different input content, or the output's size or
+    modification time changed since it was written (e.g. edited).
+    """
+    try:
+        output_stat = output_path.stat()
+        cached = json.loads(_cache_sidecar(output_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(cached, dict)
+            or cached.get("format") != _CACHE_FORMAT_VERSION
+            or cached.get("sha256") != input_sha256):
+        return None
+    # The output is meant to be edited: any change to it invalidates the cache
+    if (cached.get("output_size") != output_stat.st_size
+            or cached.get("output_mtime_ns") != output_stat.st_mtime_ns):
+        return None
+    statistics = cached.get("statistics")
+    if not isinstance(statistics, dict) or not all(
+            isinstance(statistics.get(key), int) for key in _CACHE_STAT_KEYS):
+        return None
+    return {key: statistics[key] for key in _CACHE_STAT_KEYS}
+
+
+def _save_cached_statistics(output_path: Path, input_sha256: str, statistics: dict[str, int]) -> None:
+    """Record the input hash, output size/mtime and statistics (best effort)."""
+    try:
+        output_stat = output_path.stat()
+        _cache_sidecar(output_path).write_text(
+            json.dumps({
+                "format": _CACHE_FORMAT_VERSION,
+                "sha256": input_sha256,
+                "output_size": output_stat.st_size,
+                "output_mtime_ns": output_stat.st_mtime_ns,
+                "statistics": statistics,
+            }),
+            encoding="utf-8",
+        )
+    except OSError:
+        # The output is already written; without a sidecar the next run just converts again
+        pass
 
 
-def convert_csv_to_excel(input_csv: Path) -> tuple[Path, dict[str, int]]:
+def convert_csv_to_excel(input_csv: Path) -> tuple[Path, dict[str, int], bool]:
     """
     Convert input CSV to XLSX in same directory with same file stem.
+
+    The workbook is opened in write-only mode: rows are streamed to the
+    sheet as they are appended and cannot be read back or edited.
+
+    If the XLSX already exists unchanged and its sidecar records the same
+    input SHA-256, the conversion is skipped and the cached statistics
+    returned.
     
     Returns:
-        tuple: (output_xlsx_path, statistics_dict)
+        tuple: (output_xlsx_path, statistics_dict, reused_existing_output)
         statistics_dict contains:
             - total_rows: Total rows read from CSV
             - duplicates_found: Number of duplicate products skipped
@@ -36,15 +136,17 @@ def convert_csv_to_excel(input_csv: Path) -> tuple[Path, dict[str, int]]:
     """
     output_xlsx = input_csv.with_suffix(".xlsx")
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Products"
+    # Skip the conversion when this exact CSV content was already exported
+    input_sha256 = _file_sha256(input_csv)
+    cached_statistics = _load_cached_statistics(output_xlsx, input_sha256)
+    if cached_statistics is not None:
+        return output_xlsx, cached_statistics, True
 
-    # Fixed required headers
-    ws.cell(row=1, column=1, value="نام محصول")
-    ws.cell(row=1, column=2, value="قیمت")
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Products")
 
-    out_row = 2
+    # Fixed required headers
+    ws.append(["نام محصول", "قیمت"])
     
     # Track unique product names (case-insensitive + trimmed)
     seen_products = set()
@@ -60,39 +162,40 @@ def convert_csv_to_excel(input_csv: Path) -> tuple[Path, dict[str, int]]:
         # Skip CSV header row (if present)
         _ = next(reader, None)
 
+        # Bind hot-loop lookups to locals once
+        norm_key = _norm_key
+        add_seen = seen_products.add
+        append_row = ws.append
+
         for row in reader:
             if not row:
                 continue
             
             total_rows += 1
 
-            product_name = row[0] if len(row) >= 1 else ""
-            price = row[1] if len(row) >= 2 else ""
-
-            # Skip fully empty rows only
-            if product_name == "" and price == "":
-                continue
+            # Rows are non-empty here, so one pad is enough for a missing price
+            product_name, price = (*row, "")[:2]
 
             # Normalize product name for duplicate detection
-            # Remove leading/trailing whitespace and convert to lowercase
-            normalized_name = product_name.strip().lower()
+            # Remove leading/trailing whitespace, unify Unicode composition
+            # (NFC) and fold case
+            normalized_name = norm_key(product_name)
             
-            # Skip empty product names after normalization
+            # Skip empty product names after normalization; this also covers
+            # fully empty rows, so the name is only stripped once
             if not normalized_name:
                 continue
             
-            # Check for duplicates
-            if normalized_name in seen_products:
+            # Mark this product as seen; an unchanged set size means it is
+            # a duplicate (one hash/probe instead of a lookup plus an add)
+            prev_len = len(seen_products)
+            add_seen(normalized_name)
+            if len(seen_products) == prev_len:
                 duplicates_found += 1
                 continue
-            
-            # Mark this product as seen
-            seen_products.add(normalized_name)
 
             # Preserve original values as text for exact review/edit
-            ws.cell(row=out_row, column=1, value=str(product_name))
-            ws.cell(row=out_row, column=2, value=str(price))
-            out_row += 1
+            append_row((product_name, price))
             unique_products += 1
 
     wb.save(output_xlsx)
@@ -102,8 +205,9 @@ def convert_csv_to_excel(input_csv: Path) -> tuple[Path, dict[str, int]]:
         "duplicates_found": duplicates_found,
         "unique_products": unique_products,
     }
+    _save_cached_statistics(output_xlsx, input_sha256, statistics)
     
-    return output_xlsx, statistics
+    return output_xlsx, statistics, False
 
 
 def main() -> int:
@@ -121,17 +225,27 @@ def main() -> int:
         print("[ERROR] Input file must have .csv extension.", file=sys.stderr)
         return 1
 
-    if not input_csv.exists() or not input_csv.is_file():
+    # One stat call covers both the existence and the file-type check
+    try:
+        st = os.stat(input_csv)
+    except OSError:
         print(f"[ERROR] File not found: {input_csv}", file=sys.stderr)
         return 1
 
+    if not stat.S_ISREG(st.st_mode):
+        print(f"[ERROR] Path is not a file: {input_csv}", file=sys.stderr)
+        return 1
+
     try:
-        output_xlsx, statistics = convert_csv_to_excel(input_csv)
+        output_xlsx, statistics, reused = convert_csv_to_excel(input_csv)
     except Exception as exc:  # noqa: BLE001
         print(f"[ERROR] Conversion failed: {exc}", file=sys.stderr)
         return 1
 
-    print("[OK] Conversion completed successfully.")
+    if reused:
+        print("[OK] CSV unchanged since the last conversion; existing output kept.")
+    else:
+        print("[OK] Conversion completed successfully.")
     print(f"[OK] Output file: {output_xlsx}")
     print("\n[STATISTICS]")
     print(f"  - Total rows processed: {statistics['total_rows']}")
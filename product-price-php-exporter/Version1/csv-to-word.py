@@ -16,8 +16,14 @@ CSV -> Word converter (interactive input path).
 
 from __future__ import annotations
 
+import copy
 import csv
+import hashlib
+import json
+import os
+import stat
 import sys
+import unicodedata
 from pathlib import Path
 from datetime import datetime
 
@@ -27,16 +33,160 @@ try:
     from docx.enum.text import WD_ALIGN_PARAGRAPH
     from docx.oxml.ns import qn
     from docx.oxml import OxmlElement
+    from docx.text.paragraph import Paragraph
 except ImportError:
     print("[ERROR] Required package 'python-docx' is not installed.")
     print("Please install it using: pip install python-docx")
     sys.exit(1)
 
 
+# ثابت‌های قالب‌بندی (یک بار ساخته می‌شوند، نه برای هر سلول)
+FONT_NAME = 'B Nazanin'
+HEADER_FONT_SIZE = Pt(12)
+BODY_FONT_SIZE = Pt(11)
+HEADER_FONT_COLOR = RGBColor(255, 255, 255)
+FOOTER_FONT_COLOR = RGBColor(50, 50, 50)
+ALIGN_CENTER = WD_ALIGN_PARAGRAPH.CENTER
+ALIGN_RIGHT = WD_ALIGN_PARAGRAPH.RIGHT
+
+_FILL_ATTR = qn('w:fill')
+
+
+def _make_shading(fill: str):
+    """ساخت عنصر w:shd با رنگ پس‌زمینه داده شده (برای کپی در هر سلول)."""
+    shading_elm = OxmlElement('w:shd')
+    shading_elm.set(_FILL_ATTR, fill)
+    return shading_elm
+
+
+HEADER_SHADING = _make_shading("0070C0")
+ROW_SHADING = _make_shading("E7E6E6")
+
+
+def _make_cell_paragraph(alignment, font_size, bold=None, color=None):
+    """ساخت الگوی w:p (تراز پاراگراف + یک run قالب‌بندی شده) برای کپی در سلول‌ها."""
+    paragraph = Paragraph(OxmlElement('w:p'), None)
+    paragraph.alignment = alignment
+    run = paragraph.add_run()
+    run.font.name = FONT_NAME
+    run.font.size = font_size
+    if bold is not None:
+        run.font.bold = bold
+    if color is not None:
+        run.font.color.rgb = color
+    return paragraph._p
+
+
+HEADER_PARAGRAPH = _make_cell_paragraph(ALIGN_CENTER, HEADER_FONT_SIZE, True, HEADER_FONT_COLOR)
+BODY_PARAGRAPH = _make_cell_paragraph(ALIGN_RIGHT, BODY_FONT_SIZE)
+
+
+def _fill_cell(cell, text: str, paragraph_template) -> None:
+    """
+    نوشتن متن در سلول با کپی الگوی پاراگراف آماده.
+    
+    به جای cell.text و قالب‌بندی دوباره run‌ها، محتوای سلول پاک می‌شود و
+    یک کپی از الگو (w:p > w:r با rPr آماده) با متن داده شده اضافه می‌شود.
+    """
+    tc = cell._tc
+    tc.clear_content()
+    p = copy.deepcopy(paragraph_template)
+    # آخرین فرزند w:p همان w:r است؛ تنظیم text فقط محتوا را عوض می‌کند و rPr می‌ماند
+    p[-1].text = text
+    tc.append(p)
+
+
+# Whitespace and quote characters trimmed from user-entered paths
+_QUOTE_WS = " \t\r\n\"'"
+
+
 def normalize_user_path(raw: str) -> Path:
     """Normalize input path from user (handles quotes and spaces)."""
-    cleaned = raw.strip().strip('"').strip("'").strip()
-    return Path(cleaned)
+    return Path(raw.strip(_QUOTE_WS))
+
+
+def _norm_key(s: str) -> str:
+    """ساخت کلید تشخیص تکراری (نام محصول بدون فاصله‌های اضافه، NFC و casefold).
+
+    strip فقط وقتی اجرا می‌شود که نام با فاصله شروع یا تمام شود، نام‌های ASCII
+    تمیز بدون ساخت رشته جدید برگردانده می‌شوند و فقط نام‌هایی که بررسی سریع
+    NFC را رد کنند دوباره نرمال‌سازی می‌شوند.
+    """
+    if s[:1].isspace() or s[-1:].isspace():
+        s = s.strip()
+    if s.isascii():
+        return s if s.islower() else s.lower()
+    if not unicodedata.is_normalized("NFC", s):
+        s = unicodedata.normalize("NFC", s)
+    return s.casefold()
+
+
+# اندازه بخش‌ها هنگام محاسبه هش فایل CSV
+_HASH_CHUNK_SIZE = 1 << 20
+# با تغییر ساختار فایل کناری یا معنای آمار آن، این عدد را افزایش دهید
+_CACHE_FORMAT_VERSION = 1
+_CACHE_STAT_KEYS = ("total_rows", "duplicates_found", "unique_products")
+
+
+def _file_sha256(path: Path) -> str:
+    """محاسبه هش SHA-256 فایل (به صورت بخش به بخش)."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_sidecar(output_path: Path) -> Path:
+    """مسیر فایل کناری که هش ورودی و آمار خروجی در آن ذخیره می‌شود."""
+    return output_path.with_name(output_path.name + ".sha256.json")
+
+
+def _load_cached_statistics(output_path: Path, input_sha256: str) -> dict[str, int] | None:
+    """
+    برگرداندن آمار تبدیل قبلی همین ورودی.
+    
+    اگر خروجی یا فایل کناری وجود نداشته باشد یا خوانا نباشد، نسخه قالب فایل
+    کناری متفاوت یا آمار آن ناقص باشد، فایل کناری برای محتوای دیگری ساخته شده باشد، یا اندازه یا زمان تغییر خروجی پس از ساخت
+    عوض شده باشد (مثلاً ویرایش شده)، None برگردانده می‌شود.
+    """
+    try:
+        output_stat = output_path.stat()
+        cached = json.loads(_cache_sidecar(output_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(cached, dict)
+            or cached.get("format") != _CACHE_FORMAT_VERSION
+            or cached.get("sha256") != input_sha256):
+        return None
+    # خروجی برای ویرایش است: هر تغییری در آن کش را نامعتبر می‌کند
+    if (cached.get("output_size") != output_stat.st_size
+            or cached.get("output_mtime_ns") != output_stat.st_mtime_ns):
+        return None
+    statistics = cached.get("statistics")
+    if not isinstance(statistics, dict) or not all(
+            isinstance(statistics.get(key), int) for key in _CACHE_STAT_KEYS):
+        return None
+    return {key: statistics[key] for key in _CACHE_STAT_KEYS}
+
+
+def _save_cached_statistics(output_path: Path, input_sha256: str, statistics: dict[str, int]) -> None:
+    """ذخیره هش ورودی، اندازه/زمان تغییر خروجی و آمار (در صورت امکان)."""
+    try:
+        output_stat = output_path.stat()
+        _cache_sidecar(output_path).write_text(
+            json.dumps({
+                "format": _CACHE_FORMAT_VERSION,
+                "sha256": input_sha256,
+                "output_size": output_stat.st_size,
+                "output_mtime_ns": output_stat.st_mtime_ns,
+                "statistics": statistics,
+            }),
+            encoding="utf-8",
+        )
+    except OSError:
+        # خروجی نوشته شده است؛ بدون فایل کناری اجرای بعدی فقط دوباره تبدیل می‌کند
+        pass
 
 
 def setup_rtl_support(doc: Document):
@@ -49,15 +199,19 @@ def setup_rtl_support(doc: Document):
         section.bottom_margin = Inches(1)
 
 
-def convert_csv_to_word(input_csv: Path) -> tuple[Path, dict[str, int]]:
+def convert_csv_to_word(input_csv: Path) -> tuple[Path, dict[str, int], bool]:
     """
     تبدیل فایل CSV به فایل Word با جدول قالب‌بندی شده.
     
+    اگر فایل Word از قبل بدون تغییر وجود داشته باشد و فایل کناری آن همان هش
+    SHA-256 ورودی را ثبت کرده باشد، تبدیل انجام نمی‌شود و آمار ذخیره شده
+    برمی‌گردد.
+    
     Args:
         input_csv: مسیر فایل CSV ورودی
     
     Returns:
-        tuple: (مسیر فایل word خروجی, دیکشنری آمار)
+        tuple: (مسیر فایل word خروجی, دیکشنری آمار, آیا خروجی موجود دوباره استفاده شد)
         دیکشنری آمار شامل:
             - total_rows: تعداد کل ردیف‌های خوانده شده از CSV
             - duplicates_found: تعداد محصولات تکراری که نادیده گرفته شدند
@@ -65,6 +219,12 @@ def convert_csv_to_word(input_csv: Path) -> tuple[Path, dict[str, int]]:
     """
     output_docx = input_csv.with_suffix(".docx")
 
+    # اگر همین محتوای CSV قبلاً تبدیل شده باشد، تبدیل دوباره انجام نمی‌شود
+    input_sha256 = _file_sha256(input_csv)
+    cached_statistics = _load_cached_statistics(output_docx, input_sha256)
+    if cached_statistics is not None:
+        return output_docx, cached_statistics, True
+
     # ایجاد سند Word جدید
     doc = Document()
     
@@ -73,40 +233,37 @@ def convert_csv_to_word(input_csv: Path) -> tuple[Path, dict[str, int]]:
     
     # افزودن عنوان سند
     title = doc.add_heading("لیست محصولات و قیمت‌ها", level=1)
-    title.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    title.alignment = ALIGN_RIGHT
     
     # افزودن فونت فارسی به عنوان
     for run in title.runs:
-        run.font.name = 'B Nazanin'
+        run.font.name = FONT_NAME
         run.font.size = Pt(18)
         run.font.bold = True
         run.font.color.rgb = RGBColor(0, 51, 102)
     
     # افزودن اطلاعات متا
     info_para = doc.add_paragraph()
-    info_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    info_para.alignment = ALIGN_RIGHT
     info_run = info_para.add_run(f"تاریخ ایجاد: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    info_run.font.name = 'B Nazanin'
+    info_run.font.name = FONT_NAME
     info_run.font.size = Pt(10)
     info_run.font.color.rgb = RGBColor(100, 100, 100)
     
     source_run = info_para.add_run(f"فایل منبع: {input_csv.name}")
-    source_run.font.name = 'B Nazanin'
+    source_run.font.name = FONT_NAME
     source_run.font.size = Pt(10)
     source_run.font.color.rgb = RGBColor(100, 100, 100)
     
     doc.add_paragraph()  # فاصله خالی
     
-    # خواندن داده‌ها از CSV
-    rows_data = []
-    headers = []
-    
     # آمارگیری
     seen_products = set()
     total_rows = 0
     duplicates_found = 0
     unique_products = 0
     
+    # خواندن داده‌ها از CSV؛ ردیف‌ها مستقیماً به جدول Word اضافه می‌شوند
     with input_csv.open("r", encoding="utf-8-sig", newline="") as f:
         reader = csv.reader(f)
         
@@ -115,6 +272,33 @@ def convert_csv_to_word(input_csv: Path) -> tuple[Path, dict[str, int]]:
         if not headers:
             headers = ["نام محصول", "قیمت"]
         
+        # ایجاد جدول در Word فقط با ردیف هدر
+        # تعداد ستون‌ها = تعداد هدرها
+        num_cols = len(headers)
+        
+        table = doc.add_table(rows=1, cols=num_cols)
+        table.style = 'Light Grid Accent 1'
+        
+        # تنظیم عرض جدول
+        table.autofit = False
+        table.allow_autofit = False
+        
+        # پر کردن هدر جدول
+        header_cells = table.rows[0].cells
+        for idx, header_text in enumerate(headers):
+            cell = header_cells[idx]
+            
+            # متن و قالب‌بندی سلول هدر
+            _fill_cell(cell, header_text, HEADER_PARAGRAPH)
+            
+            # رنگ پس‌زمینه هدر
+            cell._element.get_or_add_tcPr().append(copy.deepcopy(HEADER_SHADING))
+        
+        # متغیرهای محلی برای حلقه اصلی (جلوگیری از جستجوی مکرر نام‌ها)
+        norm_key = _norm_key
+        add_seen = seen_products.add
+        add_row = table.add_row
+        
         # خواندن داده‌ها
         for row in reader:
             if not row:
@@ -122,89 +306,49 @@ def convert_csv_to_word(input_csv: Path) -> tuple[Path, dict[str, int]]:
             
             total_rows += 1
             
-            product_name = row[0] if len(row) >= 1 else ""
-            
-            # پرش از ردیف‌های خالی
-            if all(cell.strip() == "" for cell in row):
-                continue
+            # ردیف خالی نیست، پس ستون اول همیشه وجود دارد
+            product_name = row[0]
             
             # نرمال‌سازی نام محصول برای شناسایی تکراری
-            normalized_name = product_name.strip().lower()
+            normalized_name = norm_key(product_name)
             
+            # پرش از ردیف‌هایی که نام محصول ندارند؛ ردیف‌های کاملاً خالی هم
+            # همین‌جا حذف می‌شوند، پس نام فقط یک بار strip می‌شود
             if not normalized_name:
                 continue
             
-            # بررسی تکراری
-            if normalized_name in seen_products:
+            # بررسی تکراری: اگر اندازه مجموعه پس از افزودن تغییر نکند، تکراری است
+            prev_len = len(seen_products)
+            add_seen(normalized_name)
+            if len(seen_products) == prev_len:
                 duplicates_found += 1
                 continue
             
-            seen_products.add(normalized_name)
-            rows_data.append(row)
             unique_products += 1
-    
-    # ایجاد جدول در Word
-    # تعداد ستون‌ها = تعداد هدرها
-    num_cols = len(headers)
-    num_rows = len(rows_data) + 1  # +1 برای ردیف هدر
-    
-    table = doc.add_table(rows=num_rows, cols=num_cols)
-    table.style = 'Light Grid Accent 1'
-    
-    # تنظیم عرض جدول
-    table.autofit = False
-    table.allow_autofit = False
-    
-    # پر کردن هدر جدول
-    header_cells = table.rows[0].cells
-    for idx, header_text in enumerate(headers):
-        cell = header_cells[idx]
-        cell.text = header_text
-        
-        # قالب‌بندی سلول هدر
-        paragraph = cell.paragraphs[0]
-        paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        for run in paragraph.runs:
-            run.font.name = 'B Nazanin'
-            run.font.size = Pt(12)
-            run.font.bold = True
-            run.font.color.rgb = RGBColor(255, 255, 255)
-        
-        # رنگ پس‌زمینه هدر
-        shading_elm = OxmlElement('w:shd')
-        shading_elm.set(qn('w:fill'), "0070C0")
-        cell._element.get_or_add_tcPr().append(shading_elm)
-    
-    # پر کردن داده‌های جدول
-    for row_idx, row_data in enumerate(rows_data, start=1):
-        row_cells = table.rows[row_idx].cells
-        
-        for col_idx, cell_value in enumerate(row_data):
-            if col_idx >= num_cols:
-                break
             
-            cell = row_cells[col_idx]
-            cell.text = str(cell_value)
+            # رنگ متناوب برای ردیف‌ها (ردیف 0 جدول هدر است)
+            shade_row = unique_products % 2 == 0
             
-            # قالب‌بندی سلول داده
-            paragraph = cell.paragraphs[0]
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+            # افزودن ردیف به جدول
+            row_cells = add_row().cells
             
-            for run in paragraph.runs:
-                run.font.name = 'B Nazanin'
-                run.font.size = Pt(11)
+            for col_idx, cell_value in enumerate(row):
+                if col_idx >= num_cols:
+                    break
+                
+                cell = row_cells[col_idx]
+                
+                # متن و قالب‌بندی سلول داده
+                _fill_cell(cell, cell_value, BODY_PARAGRAPH)
                 
-                # رنگ متناوب برای ردیف‌ها
-                if row_idx % 2 == 0:
-                    shading_elm = OxmlElement('w:shd')
-                    shading_elm.set(qn('w:fill'), "E7E6E6")
-                    cell._element.get_or_add_tcPr().append(shading_elm)
+                # سایه یک بار برای هر سلول اضافه می‌شود، نه برای هر run
+                if shade_row:
+                    cell._element.get_or_add_tcPr().append(copy.deepcopy(ROW_SHADING))
     
     # افزودن پاورقی با آمار
     doc.add_paragraph()
     footer_para = doc.add_paragraph()
-    footer_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    footer_para.alignment = ALIGN_RIGHT
     
     footer_text = f"""
     ══════════════════════════════════════
@@ -216,9 +360,9 @@ def convert_csv_to_word(input_csv: Path) -> tuple[Path, dict[str, int]]:
     """
     
     footer_run = footer_para.add_run(footer_text)
-    footer_run.font.name = 'B Nazanin'
+    footer_run.font.name = FONT_NAME
     footer_run.font.size = Pt(10)
-    footer_run.font.color.rgb = RGBColor(50, 50, 50)
+    footer_run.font.color.rgb = FOOTER_FONT_COLOR
     
     # ذخیره سند
     doc.save(output_docx)
@@ -228,8 +372,9 @@ def convert_csv_to_word(input_csv: Path) -> tuple[Path, dict[str, int]]:
         "duplicates_found": duplicates_found,
         "unique_products": unique_products,
     }
+    _save_cached_statistics(output_docx, input_sha256, statistics)
     
-    return output_docx, statistics
+    return output_docx, statistics, False
 
 
 def main() -> int:
@@ -258,15 +403,22 @@ def main() -> int:
         print("[ERROR] فایل ورودی باید پسوند .csv داشته باشد.", file=sys.stderr)
         return 1
 
-    if not input_csv.exists() or not input_csv.is_file():
+    # یک فراخوانی stat هم وجود فایل و هم نوع آن را بررسی می‌کند
+    try:
+        st = os.stat(input_csv)
+    except OSError:
         print(f"[ERROR] فایل پیدا نشد: {input_csv}", file=sys.stderr)
         return 1
 
+    if not stat.S_ISREG(st.st_mode):
+        print(f"[ERROR] مسیر داده شده یک فایل نیست: {input_csv}", file=sys.stderr)
+        return 1
+
     print()
     print("[INFO] در حال پردازش...")
     
     try:
-        output_docx, statistics = convert_csv_to_word(input_csv)
+        output_docx, statistics, reused = convert_csv_to_word(input_csv)
     except Exception as exc:
         print(f"[ERROR] تبدیل با خطا مواجه شد: {exc}", file=sys.stderr)
         import traceback
@@ -275,7 +427,10 @@ def main() -> int:
 
     print()
     print("=" * 70)
-    print("[✓] تبدیل با موفقیت انجام شد!")
+    if reused:
+        print("[✓] فایل CSV از آخرین تبدیل تغییری نکرده است؛ فایل خروجی موجود حفظ شد.")
+    else:
+        print("[✓] تبدیل با موفقیت انجام شد!")
     print("=" * 70)
     print(f"[✓] فایل خروجی: {output_docx}")
     print()
@@ -5,6 +5,7 @@ Simple test script - creates a small test CSV and converts it.
 
 from pathlib import Path
 import csv
+import io
 
 
 def create_test_csv():
@@ -25,9 +26,10 @@ def create_test_csv():
         ["لپتاپ hp laptop", "26000000", "کامپیوتر"],  # Duplicate mixed case
     ]
     
-    with open(test_file, 'w', encoding='utf-8-sig', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(test_data)
+    # Build the CSV in memory and write it (with a UTF-8 BOM) in one call
+    buffer = io.StringIO(newline='')
+    csv.writer(buffer).writerows(test_data)
+    test_file.write_bytes(buffer.getvalue().encode('utf-8-sig'))
     
     print(f"Created test CSV: {test_file}")
     return test_file